@@ -6,23 +6,30 @@ Two ways to run the application:
 
 """
 
+from __future__ import annotations
+
 import argparse
 import asyncio
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import shlex
 import sys
 import typing as t
 from importlib.metadata import version
 
-from httpx_auth import OAuth2ClientCredentials
-from mcp.client.stdio import StdioServerParameters
+if t.TYPE_CHECKING:
+    from mcp.client.stdio import StdioServerParameters
+
+    from .mcp_server import MCPServerSettings
+
+# The transport and server modules pull in the whole MCP SDK, so they are imported
+# lazily in the code paths that need them. This keeps --help and --version fast.
 
-from .config_loader import load_named_server_configs_from_file
-from .mcp_server import DEFAULT_EXPOSE_HEADERS, MCPServerSettings, run_mcp_server
-from .sse_client import run_sse_client
-from .streamablehttp_client import run_streamablehttp_client
+URL_SCHEMES: t.Final[tuple[str, ...]] = ("http://", "https://")
 
 # Deprecated env var. Here for backwards compatibility.
 SSE_URL: t.Final[str | None] = os.getenv(
@@ -36,13 +43,38 @@ def _normalize_verify_ssl(value: str | bool | None) -> bool | str | None:
     if isinstance(value, bool) or value is None:
         return value
 
-    lowered = value.strip().lower()
-    if lowered in {"1", "true", "yes", "on"}:
-        return True
-    if lowered in {"0", "false", "no", "off"}:
-        return False
+    from .httpx_client import VERIFY_SSL_VALUES
+
+    return VERIFY_SSL_VALUES.get(value.strip().lower(), value)
+
+
+def _package_version() -> str:
+    """Return the installed mcp-proxy version, or "unknown" if it cannot be determined."""
+    try:
+        return version("mcp-proxy")
+    except Exception:  # noqa: BLE001
+        return "unknown"
+
 
-    return value
+class _VersionAction(argparse.Action):
+    """Print the version and exit, looking it up only when the flag is actually used.
+
+    Resolving package metadata is the most expensive part of building the parser,
+    so it is deferred from parser construction to this action.
+    """
+
+    def __init__(self, option_strings: list[str], dest: str, help: str | None = None) -> None:  # noqa: A002
+        super().__init__(option_strings, dest, nargs=0, default=argparse.SUPPRESS, help=help)
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,  # noqa: ARG002
+        values: str | t.Sequence[t.Any] | None,  # noqa: ARG002
+        option_string: str | None = None,  # noqa: ARG002
+    ) -> None:
+        sys.stdout.write(f"{parser.prog} {_package_version()}\n")
+        parser.exit()
 
 
 def _setup_argument_parser() -> argparse.ArgumentParser:
@@ -69,15 +101,9 @@ def _setup_argument_parser() -> argparse.ArgumentParser:
 
 def _add_arguments_to_parser(parser: argparse.ArgumentParser) -> None:
     """Add all arguments to the argument parser."""
-    try:
-        package_version = version("mcp-proxy")
-    except Exception:  # noqa: BLE001
-        package_version = "unknown"
-
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"%(prog)s {package_version}",
+        action=_VersionAction,
         help="Show the version and exit",
     )
 
@@ -276,11 +302,28 @@ def _add_arguments_to_parser(parser: argparse.ArgumentParser) -> None:
 
 
 def _setup_logging(*, level: str, debug: bool) -> logging.Logger:
-    """Set up logging configuration and return the logger."""
+    """Set up logging configuration and return the logger.
+
+    Records are still formatted by the calling thread, but writing them out is handed
+    through a queue to a background thread, so a slow stderr never blocks the event loop.
+    """
     logging.basicConfig(
         level=logging.DEBUG if debug else level,
         format="[%(levelname)1.1s %(asctime)s.%(msecs).03d %(name)s] %(message)s",
     )
+    root_logger = logging.getLogger()
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in root_logger.handlers):
+        return logging.getLogger(__name__)  # Already moved behind a queue by an earlier call
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        *root_logger.handlers,
+        respect_handler_level=True,
+    )
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)  # Flushes pending records on exit
     return logging.getLogger(__name__)
 
 
@@ -295,6 +338,8 @@ def _handle_sse_client_mode(
             "--named-server arguments are ignored when command_or_url is an HTTP/HTTPS URL "
             "(SSE/StreamableHTTP client mode).",
         )
+    from httpx_auth import OAuth2ClientCredentials
+
     # Start a client connected to the SSE server, and expose as a stdio server
     logger.debug("Starting SSE/StreamableHTTP client and stdio server")
     headers = dict(args_parsed.headers)
@@ -317,6 +362,8 @@ def _handle_sse_client_mode(
     )
 
     if args_parsed.transport == "streamablehttp":
+        from .streamablehttp_client import run_streamablehttp_client
+
         asyncio.run(
             run_streamablehttp_client(
                 args_parsed.command_or_url,
@@ -326,6 +373,8 @@ def _handle_sse_client_mode(
             ),
         )
     else:
+        from .sse_client import run_sse_client
+
         asyncio.run(
             run_sse_client(
                 args_parsed.command_or_url,
@@ -341,15 +390,17 @@ def _configure_default_server(
     base_env: dict[str, str],
     logger: logging.Logger,
 ) -> StdioServerParameters | None:
-    """Configure the default server if applicable."""
-    if not (
-        args_parsed.command_or_url
-        and not args_parsed.command_or_url.startswith(("http://", "https://"))
-    ):
+    """Configure the default server if applicable.
+
+    Only called in stdio mode: main() has already dispatched URLs to client mode.
+    """
+    if not args_parsed.command_or_url:
         return None
 
-    default_server_env = base_env.copy()
-    default_server_env.update(dict(args_parsed.env))  # Specific env vars for default server
+    from mcp.client.stdio import StdioServerParameters
+
+    # Specific env vars for default server
+    default_server_env = {**base_env, **dict(args_parsed.env)}
 
     default_stdio_params = StdioServerParameters(
         command=args_parsed.command_or_url,
@@ -371,6 +422,8 @@ def _load_named_servers_from_config(
     logger: logging.Logger,
 ) -> dict[str, StdioServerParameters]:
     """Load named server configurations from a file."""
+    from .config_loader import load_named_server_configs_from_file
+
     try:
         return load_named_server_configs_from_file(config_path, base_env)
     except (FileNotFoundError, json.JSONDecodeError, ValueError):
@@ -395,42 +448,39 @@ def _configure_named_servers_from_cli(
     logger: logging.Logger,
 ) -> dict[str, StdioServerParameters]:
     """Configure named servers from CLI arguments."""
+    from mcp.client.stdio import StdioServerParameters
+
     named_stdio_params: dict[str, StdioServerParameters] = {}
 
     for name, command_string in named_server_definitions:
         try:
             command_parts = shlex.split(command_string)
-            if not command_parts:  # Handle empty command_string
-                logger.error("Empty COMMAND_STRING for named server '%s'. Skipping.", name)
-                continue
-
-            command = command_parts[0]
-            command_args = command_parts[1:]
-            # Named servers inherit base_env (which includes passed-through env)
-            # and use the proxy's CWD.
-            named_stdio_params[name] = StdioServerParameters(
-                command=command,
-                args=command_args,
-                env=base_env.copy(),  # Each named server gets a copy of the base env
-                cwd=None,  # Named servers run in the proxy's CWD
-            )
-            logger.info("Configured named server '%s': %s", name, command_string)
-        except IndexError:  # Should be caught by the check for empty command_parts
-            logger.exception(
-                "Invalid COMMAND_STRING for named server '%s': '%s'. Must include a command.",
-                name,
-                command_string,
-            )
-            sys.exit(1)
-        except Exception:
+        except ValueError:  # e.g. unbalanced quotes
             logger.exception("Error parsing COMMAND_STRING for named server '%s'", name)
             sys.exit(1)
 
+        if not command_parts:  # Handle empty command_string
+            logger.error("Empty COMMAND_STRING for named server '%s'. Skipping.", name)
+            continue
+
+        command, *command_args = command_parts
+        # Named servers inherit base_env (which includes passed-through env)
+        # and use the proxy's CWD.
+        named_stdio_params[name] = StdioServerParameters(
+            command=command,
+            args=command_args,
+            env=base_env,
+            cwd=None,  # Named servers run in the proxy's CWD
+        )
+        logger.info("Configured named server '%s': %s", name, command_string)
+
     return named_stdio_params
 
 
 def _create_mcp_settings(args_parsed: argparse.Namespace) -> MCPServerSettings:
     """Create MCP server settings from parsed arguments."""
+    from .mcp_server import DEFAULT_EXPOSE_HEADERS, MCPServerSettings
+
     expose_headers = (
         list(DEFAULT_EXPOSE_HEADERS)
         if not args_parsed.expose_headers
@@ -451,6 +501,9 @@ def main() -> None:
     parser = _setup_argument_parser()
     args_parsed = parser.parse_args()
     logger = _setup_logging(level=args_parsed.log_level, debug=args_parsed.debug)
+    is_url = bool(args_parsed.command_or_url) and args_parsed.command_or_url.startswith(
+        URL_SCHEMES,
+    )
 
     # Validate required arguments
     if (
@@ -466,9 +519,7 @@ def main() -> None:
         sys.exit(1)
 
     # Handle SSE client mode if URL is provided
-    if args_parsed.command_or_url and args_parsed.command_or_url.startswith(
-        ("http://", "https://"),
-    ):
+    if is_url:
         verify_ssl = _normalize_verify_ssl(getattr(args_parsed, "verify_ssl", None))
         _handle_sse_client_mode(args_parsed, logger, verify_ssl=verify_ssl)
         return
@@ -477,9 +528,7 @@ def main() -> None:
     logger.debug("Configuring stdio client(s) and SSE server")
 
     # Base environment for all spawned processes
-    base_env: dict[str, str] = {}
-    if args_parsed.pass_environment:
-        base_env.update(os.environ)
+    base_env: dict[str, str] = dict(os.environ) if args_parsed.pass_environment else {}
 
     # Configure default server
     default_stdio_params = _configure_default_server(args_parsed, base_env, logger)
@@ -511,6 +560,8 @@ def main() -> None:
         )
         sys.exit(1)
 
+    from .mcp_server import run_mcp_server
+
     # Create MCP server settings and run the server
     mcp_settings = _create_mcp_settings(args_parsed)
     asyncio.run(
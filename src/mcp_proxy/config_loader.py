@@ -3,11 +3,15 @@
 This module provides functionality to load named server configurations from JSON files.
 """
 
+from __future__ import annotations
+
 import json
 import logging
+import typing as t
 from pathlib import Path
 
-from mcp.client.stdio import StdioServerParameters
+if t.TYPE_CHECKING:
+    from mcp.client.stdio import StdioServerParameters
 
 logger = logging.getLogger(__name__)
 
@@ -30,12 +34,13 @@ def load_named_server_configs_from_file(
         json.JSONDecodeError: If the config file contains invalid JSON.
         ValueError: If the config file format is invalid.
     """
+    from mcp.client.stdio import StdioServerParameters
+
     named_stdio_params: dict[str, StdioServerParameters] = {}
     logger.info("Loading named server configurations from: %s", config_file_path)
 
     try:
-        with Path(config_file_path).open() as f:
-            config_data = json.load(f)
+        config_data = json.loads(Path(config_file_path).read_bytes())
     except FileNotFoundError:
         logger.exception("Configuration file not found: %s", config_file_path)
         raise
@@ -84,13 +89,10 @@ def load_named_server_configs_from_file(
             )
             continue
 
-        new_env = base_env.copy()
-        new_env.update(env)
-
         named_stdio_params[name] = StdioServerParameters(
             command=command,
             args=command_args,
-            env=new_env,
+            env={**base_env, **env} if env else base_env,
             cwd=None,
         )
         logger.info(
@@ -5,14 +5,82 @@ request and response logging capabilities.
 """
 
 import logging
-from typing import Any
+import ssl
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Final
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
-
-def custom_httpx_client(  # noqa: C901
+_SENSITIVE_HEADERS = frozenset({"authorization", "x-api-key", "cookie"})
+
+# MCP clients hold one long-lived stream and send requests in bursts with idle gaps
+# between tool calls; keep pooled connections around longer than httpx's 5s default
+# so those requests do not pay for a new TCP/TLS handshake.
+_DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+VERIFY_SSL_VALUES: Final[Mapping[str, bool]] = {
+    "1": True,
+    "true": True,
+    "yes": True,
+    "on": True,
+    "0": False,
+    "false": False,
+    "no": False,
+    "off": False,
+}
+
+
+def _ssl_context_for(ca_bundle: str) -> ssl.SSLContext:
+    """Build an SSL context trusting a CA bundle file or directory."""
+    if Path(ca_bundle).is_dir():
+        return ssl.create_default_context(capath=ca_bundle)
+    return ssl.create_default_context(cafile=ca_bundle)
+
+
+async def _log_request(request: httpx.Request) -> None:
+    """Log HTTP request details."""
+    logger.info(
+        "HTTP Request: %s %s",
+        request.method,
+        request.url,
+    )
+
+    # Log headers (be careful with sensitive data). httpx.Headers.items() already
+    # yields lowercased keys, so they can be matched against the set directly.
+    if logger.isEnabledFor(logging.DEBUG):
+        safe_headers = {
+            key: "***MASKED***" if key in _SENSITIVE_HEADERS else value
+            for key, value in request.headers.items()
+        }
+        logger.debug("Request Headers: %s", safe_headers)
+
+
+async def _log_response(response: httpx.Response) -> None:
+    """Log HTTP response details."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    request = response.request
+    logger.debug(
+        "HTTP Response: %s %s - %d %s",
+        request.method,
+        request.url,
+        response.status_code,
+        response.reason_phrase,
+    )
+
+    # Log response headers
+    logger.debug("Response Headers: %s", response.headers)
+
+
+def custom_httpx_client(
     headers: dict[str, str] | None = None,
     timeout: httpx.Timeout | None = None,
     auth: httpx.Auth | None = None,
@@ -36,6 +104,7 @@ def custom_httpx_client(  # noqa: C901
     # Set MCP defaults (copied from original implementation)
     kwargs: dict[str, Any] = {
         "follow_redirects": True,
+        "limits": _DEFAULT_LIMITS,
     }
 
     # Handle timeout
@@ -53,70 +122,30 @@ def custom_httpx_client(  # noqa: C901
         kwargs["auth"] = auth
 
     if verify_ssl is not None:
-        normalized_verify: bool | str
-        if isinstance(verify_ssl, str):
-            lowered = verify_ssl.strip().lower()
-            if lowered in {"1", "true", "yes", "on"}:
-                normalized_verify = True
-            elif lowered in {"0", "false", "no", "off"}:
-                normalized_verify = False
-            else:
-                normalized_verify = verify_ssl
-        else:
-            normalized_verify = verify_ssl
-
-        kwargs["verify"] = normalized_verify
+        normalized_verify: bool | str = (
+            VERIFY_SSL_VALUES.get(verify_ssl.strip().lower(), verify_ssl)
+            if isinstance(verify_ssl, str)
+            else verify_ssl
+        )
 
         if isinstance(normalized_verify, bool):
+            kwargs["verify"] = normalized_verify
             logger.debug(
                 "Configured httpx.AsyncClient verify=%s (SSL verification %s).",
                 normalized_verify,
                 "enabled" if normalized_verify else "disabled",
             )
         else:
+            kwargs["verify"] = _ssl_context_for(normalized_verify)
             logger.debug(
                 "Configured httpx.AsyncClient using certificate bundle at %s.",
                 normalized_verify,
             )
 
-    # Add logging event hooks
-    async def log_request(request: httpx.Request) -> None:
-        """Log HTTP request details."""
-        logger.info(
-            "HTTP Request: %s %s",
-            request.method,
-            request.url,
-        )
-
-        # Log headers (be careful with sensitive data)
-        if logger.isEnabledFor(logging.DEBUG) or True:
-            safe_headers = {}
-            for key, value in request.headers.items():
-                # Mask sensitive headers
-                if key.lower() in ("authorization", "x-api-key", "cookie"):
-                    safe_headers[key] = "***MASKED***"
-                else:
-                    safe_headers[key] = value
-            logger.info("Request Headers: %s", safe_headers)
-
-    async def log_response(response: httpx.Response) -> None:
-        """Log HTTP response details."""
-        logger.debug(
-            "HTTP Response: %s %s - %d %s",
-            response.request.method,
-            response.request.url,
-            response.status_code,
-            response.reason_phrase,
-        )
-
-        # Log response headers
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug("Response Headers: %s", dict(response.headers))
-
-    # Add event hooks
+    # Add logging event hooks. They hold no per-client state, so every client shares them.
     kwargs["event_hooks"] = {
-        "request": [log_request],
-        "response": [log_response],
+        "request": [_log_request],
+        "response": [_log_response],
     }
 
     return httpx.AsyncClient(**kwargs)
@@ -1,8 +1,9 @@
 """Create a local SSE server that proxies requests to a stdio MCP server."""
 
+import asyncio
 import contextlib
 import logging
-from collections.abc import AsyncIterator, Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Final, Literal
@@ -91,6 +92,9 @@ def create_single_instance_routes(
         json_response=True,
         stateless=stateless_instance,
     )
+    # The proxy's handlers are fully registered by now, so the options are the same
+    # for every SSE connection and only need to be built once.
+    initialization_options = mcp_server_instance.create_initialization_options()
 
     async def handle_sse_instance(request: Request) -> Response:
         async with sse_transport.connect_sse(
@@ -102,7 +106,7 @@ def create_single_instance_routes(
             await mcp_server_instance.run(
                 read_stream,
                 write_stream,
-                mcp_server_instance.create_initialization_options(),
+                initialization_options,
             )
         return Response()
 
@@ -111,7 +115,7 @@ def create_single_instance_routes(
         updated_scope = scope
         if scope.get("type") == "http":
             path = scope.get("path", "")
-            if path and path.rstrip("/") == "/mcp" and not path.endswith("/"):
+            if path == "/mcp":
                 updated_scope = dict(scope)
                 normalized_path = path + "/"
                 logger.debug(
@@ -145,6 +149,58 @@ def create_single_instance_routes(
     return routes, http_session_manager
 
 
+async def _open_sessions(
+    stack: contextlib.AsyncExitStack,
+    default_server_params: StdioServerParameters | None,
+    named_server_params: dict[str, StdioServerParameters],
+) -> dict[str | None, ClientSession]:
+    """Start every stdio backend and open a client session to it.
+
+    The contexts are entered on ``stack`` from the calling task, as anyio requires;
+    the returned sessions are keyed by mount name, with None for the default server.
+    """
+    sessions: dict[str | None, ClientSession] = {}
+    if default_server_params:
+        logger.info(
+            "Setting up default server: %s %s",
+            default_server_params.command,
+            " ".join(default_server_params.args),
+        )
+        stdio_streams = await stack.enter_async_context(stdio_client(default_server_params))
+        sessions[None] = await stack.enter_async_context(ClientSession(*stdio_streams))
+
+    for name, params in named_server_params.items():
+        logger.info(
+            "Setting up named server '%s': %s %s",
+            name,
+            params.command,
+            " ".join(params.args),
+        )
+        stdio_streams_named = await stack.enter_async_context(stdio_client(params))
+        sessions[name] = await stack.enter_async_context(ClientSession(*stdio_streams_named))
+
+    return sessions
+
+
+async def _create_proxy_servers(
+    sessions: Iterable[ClientSession],
+) -> list[MCPServerSDK[object]]:
+    """Initialize proxy servers for all sessions concurrently.
+
+    If any initialization fails, the remaining ones are cancelled before the error
+    is re-raised.
+    """
+    tasks = [asyncio.create_task(create_proxy_server(session)) for session in sessions]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # Let the cancelled handshakes unwind before the caller closes their sessions.
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 async def run_mcp_server(
     mcp_settings: MCPServerSettings,
     default_server_params: StdioServerParameters | None = None,
@@ -167,49 +223,24 @@ async def run_mcp_server(
             yield
             logger.info("Main application lifespan shutting down...")
 
-        # Setup default server if configured
-        if default_server_params:
-            logger.info(
-                "Setting up default server: %s %s",
-                default_server_params.command,
-                " ".join(default_server_params.args),
-            )
-            stdio_streams = await stack.enter_async_context(stdio_client(default_server_params))
-            session = await stack.enter_async_context(ClientSession(*stdio_streams))
-            proxy = await create_proxy_server(session)
+        sessions = await _open_sessions(stack, default_server_params, named_server_params)
+        proxies = await _create_proxy_servers(sessions.values())
 
+        for mount_name, proxy in zip(sessions, proxies, strict=True):
             instance_routes, http_manager = create_single_instance_routes(
                 proxy,
                 stateless_instance=mcp_settings.stateless,
             )
             await stack.enter_async_context(http_manager.run())  # Manage lifespan by calling run()
-            all_routes.extend(instance_routes)
-            _global_status["server_instances"]["default"] = "configured"
-
-        # Setup named servers
-        for name, params in named_server_params.items():
-            logger.info(
-                "Setting up named server '%s': %s %s",
-                name,
-                params.command,
-                " ".join(params.args),
-            )
-            stdio_streams_named = await stack.enter_async_context(stdio_client(params))
-            session_named = await stack.enter_async_context(ClientSession(*stdio_streams_named))
-            proxy_named = await create_proxy_server(session_named)
 
-            instance_routes_named, http_manager_named = create_single_instance_routes(
-                proxy_named,
-                stateless_instance=mcp_settings.stateless,
-            )
-            await stack.enter_async_context(
-                http_manager_named.run(),
-            )  # Manage lifespan by calling run()
-
-            # Mount these routes under /servers/<name>/
-            server_mount = Mount(f"/servers/{name}", routes=instance_routes_named)
-            all_routes.append(server_mount)
-            _global_status["server_instances"][name] = "configured"
+            if mount_name is None:
+                all_routes.extend(instance_routes)
+                _global_status["server_instances"]["default"] = "configured"
+            else:
+                # Mount these routes under /servers/<name>/
+                server_mount = Mount(f"/servers/{mount_name}", routes=instance_routes)
+                all_routes.append(server_mount)
+                _global_status["server_instances"][mount_name] = "configured"
 
         if not default_server_params and not named_server_params:
             logger.error("No servers configured to run.")
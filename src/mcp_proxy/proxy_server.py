@@ -5,124 +5,159 @@ This server is created independent of any transport mechanism.
 
 import logging
 import typing as t
+from collections.abc import Awaitable, Callable
+from functools import partial
 
 from mcp import server, types
 from mcp.client.session import ClientSession
 
 logger = logging.getLogger(__name__)
 
+# Handlers without a payload all answer with the same result; responses are only
+# serialized, never mutated, so one instance can be shared.
+_EMPTY_RESULT: t.Final = types.ServerResult(types.EmptyResult())
 
-async def create_proxy_server(remote_app: ClientSession) -> server.Server[object]:  # noqa: C901, PLR0915
-    """Create a server instance from a remote app."""
-    logger.debug("Sending initialization request to remote MCP server...")
-    response = await remote_app.initialize()
-    capabilities = response.capabilities
+# The handlers below are defined once at module level and bound to a session with
+# functools.partial, instead of being re-created as closures for every proxy server.
 
-    logger.debug("Configuring proxied MCP server...")
-    app: server.Server[object] = server.Server(name=response.serverInfo.name)
 
-    if capabilities.prompts:
-        logger.debug("Capabilities: adding Prompts...")
+async def _list_prompts(remote_app: ClientSession, _: t.Any) -> types.ServerResult:  # noqa: ANN401
+    result = await remote_app.list_prompts()
+    return types.ServerResult(result)
 
-        async def _list_prompts(_: t.Any) -> types.ServerResult:  # noqa: ANN401
-            result = await remote_app.list_prompts()
-            return types.ServerResult(result)
 
-        app.request_handlers[types.ListPromptsRequest] = _list_prompts
+async def _get_prompt(
+    remote_app: ClientSession,
+    req: types.GetPromptRequest,
+) -> types.ServerResult:
+    result = await remote_app.get_prompt(req.params.name, req.params.arguments)
+    return types.ServerResult(result)
 
-        async def _get_prompt(req: types.GetPromptRequest) -> types.ServerResult:
-            result = await remote_app.get_prompt(req.params.name, req.params.arguments)
-            return types.ServerResult(result)
 
-        app.request_handlers[types.GetPromptRequest] = _get_prompt
+async def _list_resources(remote_app: ClientSession, _: t.Any) -> types.ServerResult:  # noqa: ANN401
+    result = await remote_app.list_resources()
+    return types.ServerResult(result)
 
-    if capabilities.resources:
-        logger.debug("Capabilities: adding Resources...")
 
-        async def _list_resources(_: t.Any) -> types.ServerResult:  # noqa: ANN401
-            result = await remote_app.list_resources()
-            return types.ServerResult(result)
+async def _list_resource_templates(
+    remote_app: ClientSession,
+    _: t.Any,  # noqa: ANN401
+) -> types.ServerResult:
+    result = await remote_app.list_resource_templates()
+    return types.ServerResult(result)
 
-        app.request_handlers[types.ListResourcesRequest] = _list_resources
 
-        async def _list_resource_templates(_: t.Any) -> types.ServerResult:  # noqa: ANN401
-            result = await remote_app.list_resource_templates()
-            return types.ServerResult(result)
+async def _read_resource(
+    remote_app: ClientSession,
+    req: types.ReadResourceRequest,
+) -> types.ServerResult:
+    result = await remote_app.read_resource(req.params.uri)
+    return types.ServerResult(result)
 
-        app.request_handlers[types.ListResourceTemplatesRequest] = _list_resource_templates
 
-        async def _read_resource(req: types.ReadResourceRequest) -> types.ServerResult:
-            result = await remote_app.read_resource(req.params.uri)
-            return types.ServerResult(result)
+async def _set_logging_level(
+    remote_app: ClientSession,
+    req: types.SetLevelRequest,
+) -> types.ServerResult:
+    await remote_app.set_logging_level(req.params.level)
+    return _EMPTY_RESULT
 
-        app.request_handlers[types.ReadResourceRequest] = _read_resource
 
-    if capabilities.logging:
-        logger.debug("Capabilities: adding Logging...")
+async def _subscribe_resource(
+    remote_app: ClientSession,
+    req: types.SubscribeRequest,
+) -> types.ServerResult:
+    await remote_app.subscribe_resource(req.params.uri)
+    return _EMPTY_RESULT
 
-        async def _set_logging_level(req: types.SetLevelRequest) -> types.ServerResult:
-            await remote_app.set_logging_level(req.params.level)
-            return types.ServerResult(types.EmptyResult())
 
-        app.request_handlers[types.SetLevelRequest] = _set_logging_level
+async def _unsubscribe_resource(
+    remote_app: ClientSession,
+    req: types.UnsubscribeRequest,
+) -> types.ServerResult:
+    await remote_app.unsubscribe_resource(req.params.uri)
+    return _EMPTY_RESULT
 
-    if capabilities.resources:
-        logger.debug("Capabilities: adding Resources...")
 
-        async def _subscribe_resource(req: types.SubscribeRequest) -> types.ServerResult:
-            await remote_app.subscribe_resource(req.params.uri)
-            return types.ServerResult(types.EmptyResult())
+async def _list_tools(remote_app: ClientSession, _: t.Any) -> types.ServerResult:  # noqa: ANN401
+    tools = await remote_app.list_tools()
+    return types.ServerResult(tools)
 
-        app.request_handlers[types.SubscribeRequest] = _subscribe_resource
 
-        async def _unsubscribe_resource(req: types.UnsubscribeRequest) -> types.ServerResult:
-            await remote_app.unsubscribe_resource(req.params.uri)
-            return types.ServerResult(types.EmptyResult())
+async def _call_tool(remote_app: ClientSession, req: types.CallToolRequest) -> types.ServerResult:
+    try:
+        result = await remote_app.call_tool(
+            req.params.name,
+            (req.params.arguments or {}),
+        )
+        return types.ServerResult(result)
+    except Exception as e:  # noqa: BLE001
+        return types.ServerResult(
+            types.CallToolResult(
+                content=[types.TextContent(type="text", text=str(e))],
+                isError=True,
+            ),
+        )
 
-        app.request_handlers[types.UnsubscribeRequest] = _unsubscribe_resource
 
-    if capabilities.tools:
-        logger.debug("Capabilities: adding Tools...")
+async def _send_progress_notification(
+    remote_app: ClientSession,
+    req: types.ProgressNotification,
+) -> None:
+    await remote_app.send_progress_notification(
+        req.params.progressToken,
+        req.params.progress,
+        req.params.total,
+    )
 
-        async def _list_tools(_: t.Any) -> types.ServerResult:  # noqa: ANN401
-            tools = await remote_app.list_tools()
-            return types.ServerResult(tools)
 
-        app.request_handlers[types.ListToolsRequest] = _list_tools
+async def _complete(remote_app: ClientSession, req: types.CompleteRequest) -> types.ServerResult:
+    result = await remote_app.complete(
+        req.params.ref,
+        req.params.argument.model_dump(),
+    )
+    return types.ServerResult(result)
 
-        async def _call_tool(req: types.CallToolRequest) -> types.ServerResult:
-            try:
-                result = await remote_app.call_tool(
-                    req.params.name,
-                    (req.params.arguments or {}),
-                )
-                return types.ServerResult(result)
-            except Exception as e:  # noqa: BLE001
-                return types.ServerResult(
-                    types.CallToolResult(
-                        content=[types.TextContent(type="text", text=str(e))],
-                        isError=True,
-                    ),
-                )
 
-        app.request_handlers[types.CallToolRequest] = _call_tool
+_Handler: t.TypeAlias = Callable[[ClientSession, t.Any], Awaitable[types.ServerResult]]
 
-    async def _send_progress_notification(req: types.ProgressNotification) -> None:
-        await remote_app.send_progress_notification(
-            req.params.progressToken,
-            req.params.progress,
-            req.params.total,
-        )
+_CAPABILITIES: t.Final = ("prompts", "resources", "logging", "tools")
 
-    app.notification_handlers[types.ProgressNotification] = _send_progress_notification
+# Request handlers proxied when the remote server advertises the matching capability.
+_HANDLER_SPECS: t.Final[tuple[tuple[type[types.ClientRequestType], str, _Handler], ...]] = (
+    (types.ListPromptsRequest, "prompts", _list_prompts),
+    (types.GetPromptRequest, "prompts", _get_prompt),
+    (types.ListResourcesRequest, "resources", _list_resources),
+    (types.ListResourceTemplatesRequest, "resources", _list_resource_templates),
+    (types.ReadResourceRequest, "resources", _read_resource),
+    (types.SubscribeRequest, "resources", _subscribe_resource),
+    (types.UnsubscribeRequest, "resources", _unsubscribe_resource),
+    (types.SetLevelRequest, "logging", _set_logging_level),
+    (types.ListToolsRequest, "tools", _list_tools),
+    (types.CallToolRequest, "tools", _call_tool),
+)
 
-    async def _complete(req: types.CompleteRequest) -> types.ServerResult:
-        result = await remote_app.complete(
-            req.params.ref,
-            req.params.argument.model_dump(),
-        )
-        return types.ServerResult(result)
 
-    app.request_handlers[types.CompleteRequest] = _complete
+async def create_proxy_server(remote_app: ClientSession) -> server.Server[object]:
+    """Create a server instance from a remote app."""
+    logger.debug("Sending initialization request to remote MCP server...")
+    response = await remote_app.initialize()
+    capabilities = response.capabilities
+
+    logger.debug("Configuring proxied MCP server...")
+    app: server.Server[object] = server.Server(name=response.serverInfo.name)
+
+    enabled = tuple(capability for capability in _CAPABILITIES if getattr(capabilities, capability))
+    logger.debug("Capabilities: adding %s", enabled)
+
+    for request_type, capability, handler in _HANDLER_SPECS:
+        if capability in enabled:
+            app.request_handlers[request_type] = partial(handler, remote_app)
+
+    app.notification_handlers[types.ProgressNotification] = partial(
+        _send_progress_notification,
+        remote_app,
+    )
+    app.request_handlers[types.CompleteRequest] = partial(_complete, remote_app)
 
     return app
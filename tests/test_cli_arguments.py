@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import logging
+import logging.handlers
 import typing as t
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 
-from mcp_proxy.__main__ import _create_mcp_settings, _normalize_verify_ssl, _setup_argument_parser
+from mcp_proxy.__main__ import (
+    _create_mcp_settings,
+    _normalize_verify_ssl,
+    _setup_argument_parser,
+    _setup_logging,
+)
 from mcp_proxy.httpx_client import custom_httpx_client
 from mcp_proxy.mcp_server import DEFAULT_EXPOSE_HEADERS
 
 if t.TYPE_CHECKING:
     from argparse import ArgumentParser
+    from collections.abc import Generator
 
 
 @pytest.fixture
@@ -100,9 +109,94 @@ def test_custom_httpx_client_disable_ssl(mock_async_client: Mock) -> None:
     assert kwargs["verify"] is False
 
 
+@patch("mcp_proxy.httpx_client.ssl.create_default_context")
 @patch("mcp_proxy.httpx_client.httpx.AsyncClient")
-def test_custom_httpx_client_cert_path(mock_async_client: Mock) -> None:
-    """custom_httpx_client forwards certificate bundle paths."""
+def test_custom_httpx_client_cert_path(
+    mock_async_client: Mock,
+    mock_create_default_context: Mock,
+) -> None:
+    """custom_httpx_client loads certificate bundle paths into an SSL context."""
     custom_httpx_client(verify_ssl="/tmp/cert.pem")  # noqa: S108
+
+    mock_create_default_context.assert_called_once_with(cafile="/tmp/cert.pem")  # noqa: S108
     kwargs = mock_async_client.call_args.kwargs
-    assert kwargs["verify"] == "/tmp/cert.pem"  # noqa: S108
+    assert kwargs["verify"] is mock_create_default_context.return_value
+
+
+@patch("mcp_proxy.httpx_client.httpx.AsyncClient")
+async def test_custom_httpx_client_masks_sensitive_request_headers(
+    mock_async_client: Mock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """The request hook masks sensitive headers and only logs them at DEBUG."""
+    custom_httpx_client()
+    log_request = mock_async_client.call_args.kwargs["event_hooks"]["request"][0]
+    request = httpx.Request(
+        "GET",
+        "https://example.com",
+        headers={"Authorization": "Bearer secret", "X-Trace": "abc"},
+    )
+
+    with caplog.at_level(logging.INFO, logger="mcp_proxy.httpx_client"):
+        await log_request(request)
+    assert "Request Headers" not in caplog.text
+
+    with caplog.at_level(logging.DEBUG, logger="mcp_proxy.httpx_client"):
+        await log_request(request)
+    assert "***MASKED***" in caplog.text
+    assert "secret" not in caplog.text
+    assert "abc" in caplog.text
+
+
+def test_version_is_resolved_only_when_requested(capsys: pytest.CaptureFixture[str]) -> None:
+    """Building the parser does not look up the package version; --version does."""
+    with patch("mcp_proxy.__main__.version", return_value="1.2.3") as mock_version:
+        parser = _setup_argument_parser()
+        mock_version.assert_not_called()
+
+        with pytest.raises(SystemExit) as exc_info:
+            parser.parse_args(["--version"])
+
+    assert exc_info.value.code == 0
+    assert capsys.readouterr().out == f"{parser.prog} 1.2.3\n"
+
+
+class _RecordingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def recording_root_handler() -> Generator[_RecordingHandler, None, None]:
+    """Replace the root logger's handlers with a recording one, restoring them afterwards."""
+    root_logger = logging.getLogger()
+    saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+    handler = _RecordingHandler()
+    root_logger.handlers = [handler]
+    yield handler
+    root_logger.handlers = saved_handlers
+    root_logger.setLevel(saved_level)
+
+
+def test_setup_logging_installs_a_single_queue_handler(
+    recording_root_handler: _RecordingHandler,
+) -> None:
+    """Repeated _setup_logging calls keep one QueueHandler in front of the original handlers."""
+    with patch("mcp_proxy.__main__.atexit.register") as mock_register:
+        _setup_logging(level="INFO", debug=False)
+        _setup_logging(level="INFO", debug=False)
+
+    root_handlers = logging.getLogger().handlers
+    assert len(root_handlers) == 1
+    assert isinstance(root_handlers[0], logging.handlers.QueueHandler)
+    mock_register.assert_called_once()
+
+    logging.getLogger("mcp_proxy.test").warning("queued %s", "record")
+    stop_listener = mock_register.call_args.args[0]
+    stop_listener()  # Flushes the queue into the original handler
+
+    assert recording_root_handler.messages == ["queued record"]
@@ -687,6 +687,85 @@ async def test_run_mcp_server_exception_handling(
             assert "Connection failed" in str(e)  # noqa: PT017
 
 
+async def test_run_mcp_server_initializes_servers_concurrently(
+    mock_settings: MCPServerSettings,
+    mock_stdio_params: StdioServerParameters,
+) -> None:
+    """Test run_mcp_server runs the backend initialize handshakes concurrently."""
+    named_servers = {"server1": mock_stdio_params, "server2": mock_stdio_params}
+    both_started = asyncio.Event()
+    started = 0
+
+    async def create_proxy(_session: ClientSession) -> AsyncMock:
+        nonlocal started
+        started += 1
+        if started == len(named_servers):
+            both_started.set()
+        # Sequential initialization would never reach the second call and time out here.
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return AsyncMock()
+
+    with (
+        patch("mcp_proxy.mcp_server.stdio_client") as mock_stdio_client,
+        patch("mcp_proxy.mcp_server.ClientSession") as mock_client_session,
+        patch("mcp_proxy.mcp_server.create_proxy_server", side_effect=create_proxy),
+        patch("mcp_proxy.mcp_server.create_single_instance_routes") as mock_create_routes,
+        patch("uvicorn.Server") as mock_uvicorn_server,
+    ):
+        mock_stdio_context, mock_session_context, _, mock_http_manager, mock_routes = (
+            setup_async_context_mocks()
+        )
+        mock_stdio_client.return_value = mock_stdio_context
+        mock_client_session.return_value = mock_session_context
+        mock_create_routes.return_value = (mock_routes, mock_http_manager)
+        mock_uvicorn_server.return_value = AsyncMock()
+
+        await run_mcp_server(mock_settings, None, named_servers)
+
+        assert mock_create_routes.call_count == 2
+
+
+async def test_run_mcp_server_cancels_pending_initialization_on_failure(
+    mock_settings: MCPServerSettings,
+    mock_stdio_params: StdioServerParameters,
+) -> None:
+    """Test a failed initialization waits for the others to unwind before re-raising."""
+    named_servers = {"failing": mock_stdio_params, "slow": mock_stdio_params}
+    slow_started = asyncio.Event()
+    slow_cleaned_up = False
+
+    async def create_proxy(session: ClientSession) -> AsyncMock:
+        nonlocal slow_cleaned_up
+        if session is sessions["failing"]:
+            await slow_started.wait()
+            msg = "initialize failed"
+            raise RuntimeError(msg)
+        slow_started.set()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            # Cleanup that needs another loop iteration to finish.
+            await asyncio.sleep(0)
+            slow_cleaned_up = True
+        return AsyncMock()
+
+    sessions = {name: AsyncMock() for name in named_servers}
+    with (
+        patch("mcp_proxy.mcp_server.stdio_client") as mock_stdio_client,
+        patch("mcp_proxy.mcp_server.ClientSession") as mock_client_session,
+        patch("mcp_proxy.mcp_server.create_proxy_server", side_effect=create_proxy),
+    ):
+        mock_stdio_client.return_value = contextlib.nullcontext((AsyncMock(), AsyncMock()))
+        mock_client_session.side_effect = [
+            contextlib.nullcontext(session) for session in sessions.values()
+        ]
+
+        with pytest.raises(RuntimeError, match="initialize failed"):
+            await run_mcp_server(mock_settings, None, named_servers)
+
+    assert slow_cleaned_up
+
+
 async def test_run_mcp_server_both_default_and_named_servers(
     mock_settings: MCPServerSettings,
     mock_stdio_params: StdioServerParameters,